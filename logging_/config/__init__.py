@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from logging_.config.compiled_config import CompiledConfig
 from logging_.config.yaml_config import YAMLConfig
 
-__all__ = ["YAMLConfig"]
+__all__ = ["CompiledConfig", "YAMLConfig"]
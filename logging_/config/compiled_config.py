@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+import logging.config
+import logging.handlers
+import sys
+from typing import Any, Dict, Set
+
+
+def _copy_containers(value: Any):
+    """Copies nested dicts and lists, which dictConfig mutates, while sharing any other objects."""
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    return value
+
+
+class _PreResolvedConfigurator(logging.config.DictConfigurator):
+    """DictConfigurator that looks up factory import strings in a table of already resolved objects."""
+
+    def __init__(self, config: Dict[str, Any], resolved: Dict[str, Any]):
+        super().__init__(config)
+        self.resolved = resolved
+
+    def resolve(self, s: str):
+        """Returns the pre-resolved object for s, falling back to a regular import."""
+        try:
+            return self.resolved[s]
+        except KeyError:
+            return super().resolve(s)
+
+    def configure_formatter(self, config: Dict[str, Any]):
+        """Configures a formatter, using the pre-resolved class since dictConfig imports formatter classes directly."""
+        cname = config.get("class")
+        if "()" in config or cname not in self.resolved:
+            return super().configure_formatter(config)
+        kwargs = {}
+        if "validate" in config:
+            kwargs["validate"] = config["validate"]
+        if sys.version_info >= (3, 12) and config.get("defaults"):
+            kwargs["defaults"] = config["defaults"]
+        return self.resolved[cname](config.get("format"), config.get("datefmt"), config.get("style", "%"), **kwargs)
+
+    def ext_convert(self, value: str):
+        """Resolves ``ext://`` references at configure time, as they may point to objects replaced since compiling."""
+        return super().resolve(value)
+
+
+class CompiledConfig(object):
+    """CompiledConfig class for validating a logging configuration dictionary once and applying it many times.
+
+    Factory import strings used by the configuration (formatter and handler ``class`` keys and ``()`` keys) are resolved
+    up front and reused by every ``apply``, and handler ``class`` keys are checked to name ``logging.Handler``
+    subclasses. Every ``ext://`` and ``cfg://`` reference within the sections read by ``dictConfig``, and every
+    formatter, filter and handler name referenced by handlers and loggers, is checked to exist. ``ext://`` references
+    are looked up again on each ``apply``, so objects such as ``sys.stdout`` that are replaced after compiling, e.g. by
+    a forked worker redirecting its stdio, are picked up. No logging state is touched until ``apply`` is called, so a
+    configuration can be validated without side effects, e.g. in CI. The compiled object can then be applied any number
+    of times, e.g. once in each forked worker of a prefork server, without re-parsing YAML or re-importing formatter
+    and handler classes.
+
+    Example usage::
+
+        compiled = YAMLConfig.compile_file("logging.yaml")
+        # in each worker process
+        compiled.apply()
+
+    """
+
+    _sections = ("formatters", "filters", "handlers", "loggers", "root")
+
+    def __init__(self, config: Dict[str, Any]):
+        """Instantiates a CompiledConfig object from a logging configuration dictionary.
+
+        Args:
+            config: Configuration dictionary in ``logging.config.dictConfig`` schema.
+
+        Raises:
+            TypeError: if config is not a dictionary.
+            ValueError: if config is malformed, fails validation or an import string cannot be resolved.
+        """
+
+        if not isinstance(config, dict):
+            raise TypeError(f"Logging configuration must be a dictionary, got {type(config).__name__}")
+        if config.get("version") != 1:
+            raise ValueError(f"Unsupported version: {config.get('version')}")
+        self._config = _copy_containers(config)
+        self._resolved: Dict[str, Any] = {}
+        self._configurator = _PreResolvedConfigurator(_copy_containers(self._config), self._resolved)
+        self._validated_cfg: Set[str] = set()
+        for section in self._sections:
+            if section in self._config:
+                self._validate_references(self._config[section], f"config.{section}")
+        if not self._config.get("incremental", False):
+            self._validate_sections()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Returns a copy of the validated configuration dictionary."""
+        return _copy_containers(self._config)
+
+    def apply(self):
+        """Configures logging from the compiled configuration, reusing the pre-resolved import strings."""
+        _PreResolvedConfigurator(_copy_containers(self._config), self._resolved).configure()
+
+    def _resolve(self, s: str, where: str):
+        """Resolves factory import string s and caches the result for subsequent applies."""
+        if s not in self._resolved:
+            try:
+                self._resolved[s] = self._configurator.resolve(s)
+            except ValueError as e:
+                raise ValueError(f"Unable to resolve {where}: {e}") from e
+        return self._resolved[s]
+
+    def _validate_references(self, value: Any, path: str):
+        """Recursively checks that ``ext://`` and ``cfg://`` references exist, including within cfg:// targets."""
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self._validate_references(item, f"{path}.{key}")
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                self._validate_references(item, f"{path}[{index}]")
+        elif isinstance(value, str):
+            m = self._configurator.CONVERT_PATTERN.match(value)
+            if m is None:
+                return
+            prefix, suffix = m.group("prefix"), m.group("suffix")
+            if prefix == "ext":
+                try:
+                    self._configurator.ext_convert(suffix)
+                except ValueError as e:
+                    raise ValueError(f"Unable to resolve {value!r} at {path}: {e}") from e
+            elif prefix == "cfg" and value not in self._validated_cfg:
+                self._validated_cfg.add(value)
+                try:
+                    target = self._configurator.cfg_convert(suffix)
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    raise ValueError(f"Unable to resolve {value!r} at {path}: {e!r}") from e
+                self._validate_references(target, value)
+
+    def _validate_factory(self, section: str, name: str, config: Dict[str, Any], key: str):
+        """Resolves the factory import string under key, if any, checks that it is callable and returns it."""
+        factory = config.get(key)
+        if isinstance(factory, str):
+            factory = self._resolve(factory, f"{section} {name!r}")
+        if factory is not None and not callable(factory):
+            raise ValueError(f"Unable to configure {section} {name!r}: {key} {config[key]!r} is not callable")
+        return factory
+
+    @staticmethod
+    def _validate_dict(section: str, name: str, value: Any) -> Dict[str, Any]:
+        """Checks that value, the configuration of section name, is a dictionary and returns it."""
+        if not isinstance(value, dict):
+            raise ValueError(f"Unable to configure {section} {name!r}: expected a dictionary, got {value!r}")
+        return value
+
+    @staticmethod
+    def _validate_names(section: str, name: str, kind: str, names: Any, known: Dict[str, Any], objects: bool = False):
+        """Checks that names is a list of names defined in the known section, or of other objects if allowed."""
+        if names is None:
+            return
+        if not isinstance(names, (list, tuple)):
+            raise ValueError(f"Unable to configure {section} {name!r}: expected a list of {kind}s, got {names!r}")
+        for ref in names:
+            if isinstance(ref, str):
+                if ref not in known:
+                    raise ValueError(f"Unable to configure {section} {name!r}: undefined {kind} {ref!r}")
+            elif not objects:
+                raise ValueError(f"Unable to configure {section} {name!r}: invalid {kind} {ref!r}")
+
+    def _validate_sections(self):
+        """Checks factories of formatters, filters and handlers, and names referenced between sections."""
+        formatters = self._validate_dict("section", "formatters", self._config.get("formatters") or {})
+        filters = self._validate_dict("section", "filters", self._config.get("filters") or {})
+        handlers = self._validate_dict("section", "handlers", self._config.get("handlers") or {})
+        loggers = dict(self._validate_dict("section", "loggers", self._config.get("loggers") or {}))
+        if self._config.get("root") is not None:
+            loggers[""] = self._config["root"]
+        for name, formatter in formatters.items():
+            formatter = self._validate_dict("formatter", name, formatter)
+            self._validate_factory("formatter", name, formatter, "()" if "()" in formatter else "class")
+        for name, filter_ in filters.items():
+            self._validate_factory("filter", name, self._validate_dict("filter", name, filter_), "()")
+        for name, handler in handlers.items():
+            handler = self._validate_dict("handler", name, handler)
+            if "()" in handler:
+                self._validate_factory("handler", name, handler, "()")
+            elif "class" in handler:
+                factory = self._validate_factory("handler", name, handler, "class")
+                if not isinstance(factory, type) or not issubclass(factory, logging.Handler):
+                    raise ValueError(f"Unable to configure handler {name!r}: {handler['class']!r} is not a Handler")
+                # dictConfig only treats target as a handler name for MemoryHandler classes given with the class key
+                if issubclass(factory, logging.handlers.MemoryHandler) and "target" in handler:
+                    self._validate_names("handler", name, "handler", [handler["target"]], handlers)
+            else:
+                raise ValueError(f"Unable to configure handler {name!r}: missing 'class' or '()'")
+            if "formatter" in handler:
+                self._validate_names("handler", name, "formatter", [handler["formatter"]], formatters)
+            self._validate_names("handler", name, "filter", handler.get("filters"), filters, objects=True)
+        for name, logger in loggers.items():
+            logger = self._validate_dict("logger", name, logger)
+            self._validate_names("logger", name, "handler", logger.get("handlers"), handlers)
+            self._validate_names("logger", name, "filter", logger.get("filters"), filters, objects=True)
@@ -7,6 +7,8 @@ from typing import Any
 import yaml
 from yaml.parser import ParserError
 
+from logging_.config.compiled_config import CompiledConfig
+
 
 class YAMLConfig(object):
     """YAMLConfig class for loading YAML configurations with custom tagging and transformation rules.
@@ -31,6 +33,9 @@ class YAMLConfig(object):
             filename: ${LOGGING_ROOT:.}/${LOG_FILENAME:test_logger.log}
             formatter: simple
 
+    Use ``compile`` or ``compile_file`` to parse and validate a configuration once without applying it, and get a
+    reusable ``CompiledConfig`` object instead.
+
     """
 
     _envvar_sub_matcher = re.compile(r"\${([^}^{]+)}")
@@ -54,12 +59,8 @@ class YAMLConfig(object):
             TypeError: if empty YAML string is provided, ignored if ``silent=True``.
         """
 
-        yaml.add_implicit_resolver("!envvar", self._envvar_tag_matcher, None, yaml.SafeLoader)
-        yaml.add_constructor("!envvar", self._envvar_constructor, yaml.SafeLoader)
-        yaml.add_implicit_resolver("!uservar", self._uservar_tag_matcher, None, yaml.SafeLoader)
-        yaml.add_constructor("!uservar", self._uservar_constructor, yaml.SafeLoader)
         try:
-            logging.config.dictConfig(yaml.safe_load(config_yaml))
+            logging.config.dictConfig(self._load(config_yaml))
         except (ParserError, ValueError, TypeError):
             if kwargs.get("silent", False) is not True:
                 raise
@@ -90,14 +91,67 @@ class YAMLConfig(object):
             else:
                 return cls("", **kwargs)
 
-    def _envvar_constructor(self, _loader: Any, node: Any):
+    @classmethod
+    def compile(cls, config_yaml: str) -> CompiledConfig:
+        """Parses and validates configuration string without applying it.
+
+        Environment variables and user directories are expanded, and handler and formatter classes are resolved once,
+        so that the returned object can be applied many times, e.g. in each forked worker process, with
+        ``CompiledConfig.apply``. ``ext://`` references are only checked here and looked up again on each apply.
+
+        Args:
+            config_yaml: Configuration YAML string.
+
+        Returns:
+            A CompiledConfig instance.
+
+        Raises:
+            ParserError: if config_yaml isn't a valid YAML string.
+            ValueError: if config_yaml fails validation.
+            TypeError: if empty YAML string is provided.
+        """
+
+        return CompiledConfig(cls._load(config_yaml))
+
+    @classmethod
+    def compile_file(cls, filename: str) -> CompiledConfig:
+        """Parses and validates configuration file without applying it.
+
+        Args:
+            filename: Configuration file path.
+
+        Returns:
+            A CompiledConfig instance.
+
+        Raises:
+            FileNotFoundError: if filename is not a valid file path.
+            PermissionError: if there is no read permission.
+            ParserError: if the file isn't a valid YAML file.
+            ValueError: if the configuration fails validation.
+            TypeError: if the file is empty.
+        """
+
+        with open(filename, "r") as f:
+            return cls.compile(f.read())
+
+    @classmethod
+    def _load(cls, config_yaml: str) -> Any:
+        """Registers custom tags on SafeLoader and parses configuration string."""
+        yaml.add_implicit_resolver("!envvar", cls._envvar_tag_matcher, None, yaml.SafeLoader)
+        yaml.add_constructor("!envvar", cls._envvar_constructor, yaml.SafeLoader)
+        yaml.add_implicit_resolver("!uservar", cls._uservar_tag_matcher, None, yaml.SafeLoader)
+        yaml.add_constructor("!uservar", cls._uservar_constructor, yaml.SafeLoader)
+        return yaml.safe_load(config_yaml)
+
+    @classmethod
+    def _envvar_constructor(cls, _loader: Any, node: Any):
         """Replaces environment variable name with its value, or a default."""
 
         def replace_fn(match):
             envparts = f"{match.group(1)}:".split(":")
             return os.environ.get(envparts[0], envparts[1])
 
-        return os.path.expanduser(self._envvar_sub_matcher.sub(replace_fn, node.value))
+        return os.path.expanduser(cls._envvar_sub_matcher.sub(replace_fn, node.value))
 
     @staticmethod
     def _uservar_constructor(_loader: Any, node: Any):
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+import io
+import logging
+import logging.config
+import logging.handlers
+import os
+import sys
+
+import pytest
+
+from logging_.config import CompiledConfig, YAMLConfig
+
+config_yaml = """
+version: 1
+unused: ext://no_such_module.value
+buffer:
+  capacity: 10
+formatters:
+  simple:
+    format: '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+  detailed:
+    class: logging.Formatter
+    format: '%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(message)s'
+    datefmt: '%Y-%m-%d %H:%M:%S'
+handlers:
+  console:
+    class: logging.StreamHandler
+    formatter: simple
+    stream: ext://sys.stdout
+  memory:
+    class: logging.handlers.MemoryHandler
+    capacity: cfg://buffer.capacity
+    target: console
+    formatter: detailed
+    level: DEBUG
+loggers:
+  compiled_logger:
+    level: DEBUG
+    handlers:
+      - memory
+    propagate: no
+"""
+
+
+class TargetHandler(logging.Handler):
+    """Handler taking a target argument that is not a handler name"""
+
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+
+
+def test_compiled_config_applies_many_times(monkeypatch):
+    """Test fails if a compiled configuration cannot be applied more than once without resolving its classes again"""
+    compiled = YAMLConfig.compile(config_yaml)
+    resolved = []
+    resolve = logging.config.BaseConfigurator.resolve
+    monkeypatch.setattr(
+        logging.config.BaseConfigurator, "resolve", lambda self, s: resolved.append(s) or resolve(self, s)
+    )
+    resolve_ = logging.config._resolve
+    monkeypatch.setattr(logging.config, "_resolve", lambda s: resolved.append(s) or resolve_(s))
+    for _ in range(2):
+        compiled.apply()
+        assert "logging.StreamHandler" not in resolved
+        assert "logging.handlers.MemoryHandler" not in resolved
+        assert "logging.Formatter" not in resolved
+        logger = logging.getLogger("compiled_logger")
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.handlers.MemoryHandler)
+        assert logger.handlers[0].formatter.datefmt == "%Y-%m-%d %H:%M:%S"
+        assert logger.handlers[0].target.stream is sys.stdout
+
+
+def test_compiled_config_resolves_ext_references_on_apply(monkeypatch):
+    """Test fails if ext:// references are not looked up again when applying a compiled configuration"""
+    compiled = YAMLConfig.compile(config_yaml)
+    stream = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stream)
+    compiled.apply()
+    assert logging.getLogger("compiled_logger").handlers[0].target.stream is stream
+
+
+def test_compiled_config_accepts_non_handler_target():
+    """Test fails if target is validated as a handler name for handlers other than MemoryHandler"""
+    compiled = YAMLConfig.compile(
+        config_yaml.replace("class: logging.StreamHandler", f"class: {__name__}.TargetHandler").replace(
+            "stream: ext://sys.stdout", "target: some_host"
+        )
+    )
+    compiled.apply()
+    assert logging.getLogger("compiled_logger").handlers[0].target.target == "some_host"
+
+
+def test_compiled_config_does_not_configure_logging():
+    """Test fails if compiling a configuration has side effects on logging"""
+    YAMLConfig.compile(config_yaml.replace("compiled_logger", "uncompiled_logger"))
+    assert "uncompiled_logger" not in logging.root.manager.loggerDict
+
+
+def test_compiled_config_does_not_mutate_config():
+    """Test fails if compiling or applying modifies the configuration dictionary"""
+    compiled = YAMLConfig.compile(config_yaml)
+    config = compiled.config
+    CompiledConfig(config).apply()
+    assert config == compiled.config
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ("class: logging.StreamHandler", "class: logging.NoSuchHandler"),
+        ("ext://sys.stdout", "ext://sys.no_such_stream"),
+        ("cfg://buffer.capacity", "cfg://buffer.no_such_key"),
+        ("formatter: simple", "formatter: no_such_formatter"),
+        ("target: console", "target: no_such_handler"),
+        ("- memory", "- no_such_handler"),
+        ("version: 1", "version: 2"),
+        ("class: logging.StreamHandler", "class: logging.Formatter"),
+        ("  simple:\n    format: '%(asctime)s - %(name)s - %(levelname)s - %(message)s'", "  simple:"),
+        (
+            "  console:\n    class: logging.StreamHandler\n    formatter: simple\n    stream: ext://sys.stdout",
+            "  console:",
+        ),
+        ("handlers:\n  console:", "handlers:\n  - console\nunused_handlers:\n  console:"),
+        ("handlers:\n      - memory", "handlers: 5"),
+    ],
+)
+def test_compiled_config_raises_for_invalid_config(old, new):
+    """Test fails if invalid references or malformed sections are not detected at compile time"""
+    assert old in config_yaml
+    with pytest.raises(ValueError):
+        YAMLConfig.compile(config_yaml.replace(old, new))
+
+
+def test_compiled_config_raises_for_empty_config():
+    """Test fails if empty YAML configuration does not raise error"""
+    with pytest.raises(TypeError):
+        YAMLConfig.compile("")
+
+
+def test_compiled_config_from_file(fs):
+    """Test fails if a compiled configuration cannot be created from Yaml file"""
+    fs.create_dir(os.path.expanduser("~"))
+    fs.create_file("logging.yaml", contents=config_yaml)
+    assert YAMLConfig.compile_file("logging.yaml").config["handlers"]["memory"]["target"] == "console"